@@ -1,7 +1,13 @@
-import requests
+import asyncio
+import aiohttp
+from aiohttp_client_cache import CachedSession, SQLiteBackend
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 from datetime import datetime
-import json
+from itertools import zip_longest
+import orjson
 import time
 import os
 from dotenv import load_dotenv
@@ -22,40 +28,87 @@ ARTIST_NAME = 'Linkin Park'
 TSV_FILE = 'unclaimedmusicalworkrightshares.tsv'
 OUTPUT_EXCEL = 'music_rights_analysis.xlsx'
 OUTPUT_JSON = 'results.json'
-CHUNK_SIZE = 100000  # Process 100k rows at a time
+INDEX_CACHE_FILE = 'isrc_index.parquet'  # Parsed ISRC index, reused while newer than TSV_FILE
+CHUNK_SIZE = 500000  # Process 500k rows at a time
+TSV_COLUMNS = ['row_id', 'track_id', 'code1', 'isrc']  # First four columns, see Dataset_info.md
+TSV_SCHEMA = pa.schema([(column, pa.string()) for column in TSV_COLUMNS])
+ISRC_PATTERN = r'^[A-Za-z]{2}[A-Za-z0-9]{3}[0-9]{7}$'  # 2 letters + 3 alphanumeric + 7 digits, ASCII only, any case
+MAX_CONCURRENT_REQUESTS = 10  # Parallel Spotify API calls
+MAX_RETRIES = 5  # Retries per Spotify API call
+RETRY_BACKOFF = 0.2  # Seconds, doubled after every retry
+RETRY_STATUSES = {429, 500, 502, 503}
+API_CACHE_NAME = 'spotify_cache'  # SQLite cache of Spotify GET responses
+API_CACHE_EXPIRE = 86400  # Seconds before cached responses are fetched again
+ARROW_STRING_DTYPES = {pa.string(): pd.StringDtype('pyarrow')}  # Keep Arrow strings when converting to pandas
 
 class SpotifyAPI:
-    def __init__(self, client_id, client_secret):
+    def __init__(self, session, client_id, client_secret):
+        self.session = session
         self.client_id = client_id
         self.client_secret = client_secret
         self.token = None
         self.token_expires = 0
+        self.semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)  # Rate limiting
+        self.token_lock = asyncio.Lock()  # Single token refresh for concurrent callers
         
-    def get_token(self):
+    async def get_token(self):
         """Get access token from Spotify API"""
         if self.token and time.time() < self.token_expires:
             return self.token
-            
-        auth_url = 'https://accounts.spotify.com/api/token'
-        auth_response = requests.post(auth_url, {
-            'grant_type': 'client_credentials',
-            'client_id': self.client_id,
-            'client_secret': self.client_secret,
-        })
         
-        if auth_response.status_code != 200:
-            raise Exception(f"Authentication failed: {auth_response.text}")
-            
-        auth_data = auth_response.json()
-        self.token = auth_data['access_token']
-        self.token_expires = time.time() + auth_data['expires_in'] - 60
-        return self.token
+        async with self.token_lock:
+            # Another caller may have refreshed the token while we waited
+            if self.token and time.time() < self.token_expires:
+                return self.token
+                
+            auth_url = 'https://accounts.spotify.com/api/token'
+            async with self.session.post(auth_url, data={
+                'grant_type': 'client_credentials',
+                'client_id': self.client_id,
+                'client_secret': self.client_secret,
+            }) as auth_response:
+                if auth_response.status != 200:
+                    raise Exception(f"Authentication failed: {await auth_response.text()}")
+                auth_data = await auth_response.json()
+                
+            self.token = auth_data['access_token']
+            self.token_expires = time.time() + auth_data['expires_in'] - 60
+            return self.token
     
-    def search_artist(self, artist_name):
-        """Search for artist and return artist ID"""
-        token = self.get_token()
+    async def _get(self, url, params=None):
+        """GET a Spotify endpoint, retrying 429/5xx responses and dropped connections"""
+        token = await self.get_token()
         headers = {'Authorization': f'Bearer {token}'}
         
+        async with self.semaphore:
+            for attempt in range(MAX_RETRIES + 1):
+                backoff = RETRY_BACKOFF * 2 ** attempt
+                try:
+                    async with self.session.get(url, headers=headers, params=params) as response:
+                        if response.status in RETRY_STATUSES and attempt < MAX_RETRIES:
+                            # Spotify tells us how long to wait when rate limited
+                            await asyncio.sleep(float(response.headers.get('Retry-After', backoff)))
+                            continue
+                        # Out of retries (or a non-retryable error): fail clearly
+                        response.raise_for_status()
+                        return await response.json()
+                except aiohttp.ClientConnectionError:
+                    if attempt == MAX_RETRIES:
+                        raise
+                    await asyncio.sleep(backoff)
+    
+    async def _get_paged(self, url, params):
+        """Follow 'next' links and collect all items of a paged endpoint"""
+        items = []
+        while url:
+            data = await self._get(url, params)
+            items.extend(data['items'])
+            url = data.get('next')
+            params = None  # Only use params on first request
+        return items
+    
+    async def search_artist(self, artist_name):
+        """Search for artist and return artist ID"""
         search_url = 'https://api.spotify.com/v1/search'
         params = {
             'q': artist_name,
@@ -63,8 +116,7 @@ class SpotifyAPI:
             'limit': 1
         }
         
-        response = requests.get(search_url, headers=headers, params=params)
-        data = response.json()
+        data = await self._get(search_url, params)
         
         if not data['artists']['items']:
             return None
@@ -78,167 +130,177 @@ class SpotifyAPI:
             'popularity': artist['popularity']
         }
     
-    def get_artist_albums(self, artist_id):
+    async def get_artist_albums(self, artist_id):
         """Get all albums for an artist"""
-        token = self.get_token()
-        headers = {'Authorization': f'Bearer {token}'}
-        
-        albums = []
         url = f'https://api.spotify.com/v1/artists/{artist_id}/albums'
         params = {
             'include_groups': 'album,single,compilation',
             'limit': 50,
             'market': 'US'
         }
-        
-        while url:
-            response = requests.get(url, headers=headers, params=params)
-            data = response.json()
-            albums.extend(data['items'])
-            url = data.get('next')
-            params = None  # Only use params on first request
-            time.sleep(0.1)  # Rate limiting
-            
-        return albums
+        return await self._get_paged(url, params)
     
-    def get_album_tracks(self, album_id):
+    async def get_album_tracks(self, album_id):
         """Get all tracks from an album"""
-        token = self.get_token()
-        headers = {'Authorization': f'Bearer {token}'}
-        
-        tracks = []
         url = f'https://api.spotify.com/v1/albums/{album_id}/tracks'
         params = {'limit': 50, 'market': 'US'}
-        
-        while url:
-            response = requests.get(url, headers=headers, params=params)
-            data = response.json()
-            tracks.extend(data['items'])
-            url = data.get('next')
-            params = None
-            time.sleep(0.1)
-            
-        return tracks
+        return await self._get_paged(url, params)
     
-    def get_track_details(self, track_ids):
+    async def get_track_details(self, track_ids):
         """Get detailed track information including ISRC"""
-        token = self.get_token()
-        headers = {'Authorization': f'Bearer {token}'}
-        
         # Spotify allows up to 50 tracks per request
+        url = 'https://api.spotify.com/v1/tracks'
+        batches = [track_ids[i:i+50] for i in range(0, len(track_ids), 50)]
+        results = await asyncio.gather(*[
+            self._get(url, {'ids': ','.join(batch), 'market': 'US'}) for batch in batches
+        ])
+        
+        # gather preserves order, so tracks line up with track_ids
         all_tracks = []
-        for i in range(0, len(track_ids), 50):
-            batch = track_ids[i:i+50]
-            url = 'https://api.spotify.com/v1/tracks'
-            params = {'ids': ','.join(batch), 'market': 'US'}
-            
-            response = requests.get(url, headers=headers, params=params)
-            data = response.json()
+        for data in results:
             all_tracks.extend(data['tracks'])
-            time.sleep(0.1)
             
         return all_tracks
 
-def load_unclaimed_dataset(tsv_file):
-    """Load and index the unclaimed works dataset by ISRC - Memory efficient chunked processing"""
+def open_tsv_reader(tsv_file):
+    """Stream the first four columns of the dataset as Arrow record batches"""
+    # The trailing metadata columns vary in number from row to row, so let the
+    # pandas C parser pick out the first four; it keeps ragged rows intact
+    for chunk in pd.read_csv(
+        tsv_file,
+        sep='\t',
+        encoding='utf-8',
+        header=None,
+        names=TSV_COLUMNS,
+        usecols=[0, 1, 2, 3],  # Only load first 4 columns
+        dtype=str,  # Keep IDs as text
+        na_filter=False,  # No per-value NaN checks, 'NA' stays a plain string
+        on_bad_lines='warn',  # Report and skip lines the tokenizer cannot parse
+        engine='c',
+        memory_map=True,
+        chunksize=CHUNK_SIZE
+    ):
+        yield pa.RecordBatch.from_pandas(chunk, schema=TSV_SCHEMA, preserve_index=False)
+
+def index_by_isrc(rows):
+    """Index dataset rows by ISRC, keeping the first occurrence of each"""
+    isrc_index = rows.drop_duplicates('isrc').set_index('isrc')
+    # code1 has few distinct values, store it as integer codes
+    isrc_index['code1'] = isrc_index['code1'].astype('category')
+    return isrc_index
+
+def load_unclaimed_dataset(tsv_file, isrcs=None, cache_file=INDEX_CACHE_FILE):
+    """Load and index the unclaimed works dataset by ISRC - Memory efficient streamed processing
+    
+    Returns a DataFrame indexed by ISRC with row_id, track_id and code1 columns.
+    When isrcs is given, only rows for those ISRCs are kept in memory.
+    All valid rows are cached to cache_file and reused while it is newer than tsv_file.
+    """
+    value_set = pa.array(sorted(isrcs), pa.string()) if isrcs is not None else None
+    
+    if cache_file and os.path.exists(cache_file) and \
+            os.path.getmtime(cache_file) > os.path.getmtime(tsv_file):
+        print(f"Loading cached ISRC index from {cache_file}...")
+        table = pq.read_table(cache_file, memory_map=True)
+        if value_set is not None:
+            table = table.filter(pc.is_in(table.column('isrc'), value_set=value_set))
+        isrc_index = index_by_isrc(table.to_pandas(types_mapper=ARROW_STRING_DTYPES.get))
+        print(f"✓ Unique ISRCs indexed: {len(isrc_index):,}")
+        return isrc_index
+    
     print(f"Loading dataset from {tsv_file}...")
     print(f"Processing in chunks of {CHUNK_SIZE:,} rows to handle large file...")
     
+    writer = None
     try:
-        isrc_index = {}
+        parts = []
         total_rows = 0
         valid_isrcs = 0
-        chunk_count = 0
         
-        # Process file in chunks with minimal memory usage
-        for chunk in pd.read_csv(
-            tsv_file, 
-            sep='\t', 
-            encoding='utf-8', 
-            header=None, 
-            chunksize=CHUNK_SIZE,
-            usecols=[0, 1, 2, 3],  # Only load first 4 columns
-            dtype=str,  # Load everything as string to avoid type inference issues
-            on_bad_lines='skip',
-            low_memory=True,  # Use low_memory mode
-            engine='python'  # Python engine is more forgiving with large files
-        ):
-            chunk_count += 1
-            chunk_len = len(chunk)
-            total_rows += chunk_len
+        # Stream the file as Arrow record batches with minimal memory usage
+        for batch in open_tsv_reader(tsv_file):
+            total_rows += batch.num_rows
             
-            # Assign column names
-            chunk.columns = ['row_id', 'track_id', 'code1', 'isrc']
+            # Validate trimmed ISRCs against an ASCII-only pattern with Arrow kernels,
+            # then upper-case only the rows that passed
+            isrc = pc.utf8_trim_whitespace(batch.column('isrc'))
+            mask = pc.match_substring_regex(isrc, ISRC_PATTERN)
+            batch = batch.filter(mask)
+            batch = pa.RecordBatch.from_arrays(
+                [batch.column(column) for column in TSV_COLUMNS[:-1]] + [pc.ascii_upper(isrc.filter(mask))],
+                schema=TSV_SCHEMA
+            )
+            valid_isrcs += batch.num_rows
             
-            # Process each row directly to minimize memory
-            for idx in range(chunk_len):
-                try:
-                    row = chunk.iloc[idx]
-                    isrc = str(row['isrc']).strip().upper()
-                    
-                    # Skip invalid ISRCs
-                    if isrc in ['NAN', 'NA', 'NONE', '']:
-                        continue
-                    
-                    # Basic ISRC format validation (optional, speeds up processing)
-                    if len(isrc) == 12:  # Standard ISRC length
-                        # Only store if not already in index (avoid duplicates)
-                        if isrc not in isrc_index:
-                            isrc_index[isrc] = {
-                                'row_id': str(row['row_id']),
-                                'track_id': str(row['track_id']),
-                                'code1': str(row['code1']),
-                                'isrc': str(row['isrc'])
-                            }
-                            valid_isrcs += 1
-                except Exception as e:
-                    # Skip problematic rows
-                    continue
+            # Every valid row goes to the cache so later runs can serve any artist
+            if cache_file:
+                if writer is None:
+                    writer = pq.ParquetWriter(cache_file + '.tmp', batch.schema)
+                writer.write_batch(batch)
             
-            # Progress update every million rows
-            if total_rows % 1000000 == 0:
-                print(f"  Processed {total_rows:,} rows... ({len(isrc_index):,} unique ISRCs indexed)")
+            # Only keep rows for the requested ISRCs in memory
+            if value_set is not None:
+                batch = batch.filter(pc.is_in(batch.column('isrc'), value_set=value_set))
+            parts.append(batch)
             
-            # Clear chunk from memory
-            del chunk
+            # Progress update after every chunk
+            print(f"  Processed {total_rows:,} rows... ({valid_isrcs:,} valid ISRC rows)")
+            
+            # Clear batch from memory
+            del batch, isrc, mask
+        
+        # Combine the kept batches without copying and dedupe them in one pass
+        combined = pa.Table.from_batches(parts, schema=TSV_SCHEMA)
+        isrc_index = index_by_isrc(combined.to_pandas(types_mapper=ARROW_STRING_DTYPES.get))
+        del parts, combined
         
         print(f"\n✓ Dataset processing complete!")
         print(f"  Total rows processed: {total_rows:,}")
-        print(f"  Unique ISRCs indexed: {len(isrc_index):,}")
         print(f"  Valid ISRC codes: {valid_isrcs:,}")
+        print(f"  Rows skipped (missing or invalid ISRC): {total_rows - valid_isrcs:,}")
+        print(f"  Unique ISRCs indexed: {len(isrc_index):,}")
+        
+        if writer is not None:
+            writer.close()
+            os.replace(cache_file + '.tmp', cache_file)
+            print(f"  Cached valid rows to {cache_file}")
         
-        return None, isrc_index  # Return None for df to maintain compatibility
+        return isrc_index
         
     except Exception as e:
         print(f"Error loading dataset: {e}")
         import traceback
         traceback.print_exc()
-        return None, {}
+        # Don't leave a half-written cache behind
+        if writer is not None:
+            writer.close()
+            os.remove(cache_file + '.tmp')
+        return None
 
-def fetch_artist_catalog(spotify, artist_name):
-    """Fetch complete artist catalog with ISRCs"""
+async def fetch_artist_catalog(spotify, artist_name):
+    """Fetch complete artist catalog with ISRCs as a DataFrame, one row per track"""
     print(f"\nSearching for artist: {artist_name}")
     
-    artist_info = spotify.search_artist(artist_name)
+    artist_info = await spotify.search_artist(artist_name)
     if not artist_info:
         print(f"Artist '{artist_name}' not found")
-        return None, []
+        return None, pd.DataFrame()
     
     print(f"Found: {artist_info['name']}")
     print(f"Followers: {artist_info['followers']:,}")
     print(f"Popularity: {artist_info['popularity']}/100")
     
     print("\nFetching albums...")
-    albums = spotify.get_artist_albums(artist_info['id'])
+    albums = await spotify.get_artist_albums(artist_info['id'])
     print(f"Found {len(albums)} albums/singles/compilations")
     
     catalog = []
     track_ids = []
     
     print("\nFetching tracks from albums...")
-    for idx, album in enumerate(albums, 1):
-        print(f"Processing {idx}/{len(albums)}: {album['name']}")
-        tracks = spotify.get_album_tracks(album['id'])
+    album_tracks = await asyncio.gather(*[spotify.get_album_tracks(album['id']) for album in albums])
+    for idx, (album, tracks) in enumerate(zip(albums, album_tracks), 1):
+        print(f"Processed {idx}/{len(albums)}: {album['name']} ({len(tracks)} tracks)")
         
         for track in tracks:
             track_ids.append(track['id'])
@@ -253,29 +315,40 @@ def fetch_artist_catalog(spotify, artist_name):
             })
     
     print(f"\nFetching ISRC codes for {len(track_ids)} tracks...")
-    detailed_tracks = spotify.get_track_details(track_ids)
-    
-    # Add ISRC codes
-    for i, track in enumerate(catalog):
-        if i < len(detailed_tracks) and detailed_tracks[i]:
-            track['isrc'] = detailed_tracks[i].get('external_ids', {}).get('isrc', 'N/A')
-            track['explicit'] = detailed_tracks[i].get('explicit', False)
-            track['popularity'] = detailed_tracks[i].get('popularity', 0)
+    detailed_tracks = await spotify.get_track_details(track_ids)
+    
+    # Add ISRC codes (details line up with catalog; missing ones pad as None)
+    for track, details in zip_longest(catalog, detailed_tracks[:len(catalog)]):
+        if details:
+            track['isrc'] = details.get('external_ids', {}).get('isrc', 'N/A')
+            track['explicit'] = details.get('explicit', False)
+            track['popularity'] = details.get('popularity', 0)
         else:
             track['isrc'] = 'N/A'
     
+    # Everything downstream works on the catalog as a DataFrame
+    if not catalog:
+        return artist_info, pd.DataFrame()
+    catalog = pd.DataFrame(catalog)
+    catalog['album_type'] = catalog['album_type'].astype('category')
+    if 'popularity' in catalog:
+        # Nullable ints keep popularity integral when some tracks lack details
+        catalog['popularity'] = catalog['popularity'].astype('Int64')
     return artist_info, catalog
 
 def cross_reference_catalog(catalog, isrc_index):
-    """Cross-reference catalog with unclaimed works dataset"""
+    """Cross-reference catalog with unclaimed works dataset, returning the matching rows"""
     print("\nCross-referencing with unclaimed works dataset...")
     
-    matches = []
-    for track in catalog:
-        isrc = track.get('isrc', 'N/A')
-        if isrc != 'N/A' and isrc in isrc_index:
-            match = {**track, **isrc_index[isrc]}
-            matches.append(match)
+    # Probe the index for the few catalog ISRCs first so the join only sees
+    # the hits instead of hashing (and coercing) the whole index
+    hits = isrc_index[isrc_index.index.isin(catalog['isrc'])]
+    
+    # Dataset fields take precedence over catalog fields with the same name
+    overlap = catalog.columns.intersection(isrc_index.columns)
+    matches = catalog.drop(columns=overlap).merge(
+        hits, left_on='isrc', right_index=True, how='inner'
+    ).reset_index(drop=True)
     
     print(f"Found {len(matches)} matches in unclaimed works dataset")
     return matches
@@ -284,17 +357,18 @@ def create_excel_report(artist_info, catalog, matches, output_file):
     """Create Excel file with three sheets"""
     print(f"\nCreating Excel report: {output_file}")
     
-    with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
+    with pd.ExcelWriter(output_file, engine='xlsxwriter') as writer:
         # Sheet 1: Full Artist Catalog
-        df_catalog = pd.DataFrame(catalog)
-        df_catalog = df_catalog.sort_values(['release_date', 'album_name', 'track_number'], 
-                                           ascending=[False, True, True])
-        df_catalog.to_excel(writer, sheet_name='Artist Catalog', index=False)
+        # Sort in place rather than writing a sorted copy, then restore the
+        # API order (the original index) for the dashboard JSON
+        catalog.sort_values(['release_date', 'album_name', 'track_number'], 
+                            ascending=[False, True, True], inplace=True)
+        catalog.to_excel(writer, sheet_name='Artist Catalog', index=False)
+        catalog.sort_index(inplace=True)
         
         # Sheet 2: Matches (Unclaimed Works)
-        if matches:
-            df_matches = pd.DataFrame(matches)
-            df_matches.to_excel(writer, sheet_name='Unclaimed Matches', index=False)
+        if not matches.empty:
+            matches.to_excel(writer, sheet_name='Unclaimed Matches', index=False)
         else:
             # Create empty sheet with message
             df_empty = pd.DataFrame({'Message': ['No matches found in unclaimed works dataset']})
@@ -325,9 +399,9 @@ def create_excel_report(artist_info, catalog, matches, output_file):
                 f"{artist_info['followers']:,}",
                 f"{artist_info['popularity']}/100",
                 len(catalog),
-                len([t for t in catalog if t.get('isrc', 'N/A') != 'N/A']),
+                int((catalog['isrc'] != 'N/A').sum()),
                 len(matches),
-                f"{(len(matches) / len(catalog) * 100):.2f}%" if catalog else '0%',
+                f"{(len(matches) / len(catalog) * 100):.2f}%" if len(catalog) else '0%',
                 '',
                 datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
                 TSV_FILE,
@@ -344,27 +418,32 @@ def create_excel_report(artist_info, catalog, matches, output_file):
     
     print(f"Excel report created successfully!")
 
+def records_for_json(df):
+    """Convert rows to dicts, leaving out missing values like tracks without details"""
+    return [{key: value for key, value in record.items() if not pd.isna(value)}
+            for record in df.to_dict('records')]
+
 def save_json_for_dashboard(artist_info, catalog, matches):
     """Save data as JSON for HTML dashboard"""
     data = {
         'artist': artist_info,
-        'catalog': catalog,
-        'matches': matches,
+        'catalog': records_for_json(catalog),
+        'matches': records_for_json(matches),
         'stats': {
             'total_tracks': len(catalog),
-            'tracks_with_isrc': len([t for t in catalog if t.get('isrc', 'N/A') != 'N/A']),
+            'tracks_with_isrc': int((catalog['isrc'] != 'N/A').sum()),
             'unclaimed_matches': len(matches),
-            'match_rate': (len(matches) / len(catalog) * 100) if catalog else 0
+            'match_rate': (len(matches) / len(catalog) * 100) if len(catalog) else 0
         },
         'generated_at': datetime.now().isoformat()
     }
     
-    with open(OUTPUT_JSON, 'w') as f:
-        json.dump(data, f, indent=2)
+    with open(OUTPUT_JSON, 'wb') as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
     
     print(f"JSON data saved to {OUTPUT_JSON}")
 
-def main():
+async def main():
     print("=" * 60)
     print("SPOTIFY MUSIC RIGHTS ANALYZER")
     print("=" * 60)
@@ -375,27 +454,31 @@ def main():
         print("Please download the file and place it in the same directory as this script.")
         return
     
-    # Initialize Spotify API
-    spotify = SpotifyAPI(CLIENT_ID, CLIENT_SECRET)
+    # Fetch artist catalog
+    # One pooled session keeps connections to Spotify alive across all calls.
+    # GET responses are cached on disk so re-runs skip the API; the token POST never is
+    connector = aiohttp.TCPConnector(limit=2 * MAX_CONCURRENT_REQUESTS, limit_per_host=MAX_CONCURRENT_REQUESTS)
+    cache = SQLiteBackend(API_CACHE_NAME, expire_after=API_CACHE_EXPIRE, allowed_methods=('GET',))
+    async with CachedSession(cache=cache, connector=connector) as session:
+        spotify = SpotifyAPI(session, CLIENT_ID, CLIENT_SECRET)
+        artist_info, catalog = await fetch_artist_catalog(spotify, ARTIST_NAME)
+        
+        if not artist_info or catalog.empty:
+            print("\nTrying alternative artist: Radiohead")
+            artist_info, catalog = await fetch_artist_catalog(spotify, 'Radiohead')
+            
+            if not artist_info or catalog.empty:
+                print("Failed to fetch artist data. Exiting.")
+                return
     
-    # Load unclaimed works dataset (chunked processing)
-    dataset, isrc_index = load_unclaimed_dataset(TSV_FILE)
+    # Load unclaimed works dataset (streamed in chunks), keeping only catalog ISRCs
+    catalog_isrcs = set(catalog.loc[catalog['isrc'] != 'N/A', 'isrc'])
+    isrc_index = load_unclaimed_dataset(TSV_FILE, catalog_isrcs)
     
-    if not isrc_index:
+    if isrc_index is None:
         print("Failed to load dataset. Exiting.")
         return
     
-    # Fetch artist catalog
-    artist_info, catalog = fetch_artist_catalog(spotify, ARTIST_NAME)
-    
-    if not artist_info or not catalog:
-        print("\nTrying alternative artist: Radiohead")
-        artist_info, catalog = fetch_artist_catalog(spotify, 'Radiohead')
-        
-        if not artist_info or not catalog:
-            print("Failed to fetch artist data. Exiting.")
-            return
-    
     # Cross-reference with unclaimed works
     matches = cross_reference_catalog(catalog, isrc_index)
     
@@ -415,4 +498,4 @@ def main():
     print("=" * 60)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
@@ -18,7 +18,7 @@ def check_python_version():
 
 def check_dependencies():
     """Check if required packages are installed"""
-    required = ['requests', 'pandas', 'openpyxl']
+    required = ['requests', 'aiohttp', 'aiohttp_client_cache', 'pandas', 'pyarrow', 'xlsxwriter', 'orjson']
     missing = []
     
     for package in required:
@@ -110,7 +110,9 @@ def check_dataset_structure():
         import pandas as pd
         
         # Read without header since the dataset doesn't have column names
-        df = pd.read_csv('unclaimedmusicalworkrightshares.tsv', sep='\t', nrows=10, header=None)
+        # Parse like main.py does: all text, no NaN detection
+        df = pd.read_csv('unclaimedmusicalworkrightshares.tsv', sep='\t', nrows=10, header=None,
+                         engine='c', dtype=str, na_filter=False)
         print(f"✓ Dataset loaded successfully ({len(df.columns)} columns, {len(df)} sample rows)")
         
         if len(df.columns) >= 4: